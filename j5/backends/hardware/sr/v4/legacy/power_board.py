@@ -94,6 +94,7 @@ class SRV4LegacyPowerBoardHardwareBackend(
             0: False,
             1: False,
         }
+        self._firmware_version = self._read_firmware_version()
         self.check_firmware_version_supported()
 
     def check_firmware_version_supported(self) -> None:
@@ -113,8 +114,18 @@ class SRV4LegacyPowerBoardHardwareBackend(
         """
         The firmware version reported by the board.
 
+        Cached at initialisation.
+
         :returns: firmware version reported by the board, if any.
         """
+        return self._firmware_version
+
+    def _read_firmware_version(self) -> str:
+        """
+        Read the firmware version from the board.
+
+        :returns: firmware version reported by the board.
+        """
         (version,) = struct.unpack("<I", self._read(CMD_READ_FWVER))
         return str(cast(int, version))
 
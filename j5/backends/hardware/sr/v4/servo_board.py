@@ -56,6 +56,7 @@ class SRV4ServoBoardHardwareBackend(
 
         self._usb_device = usb_device
 
+        self._firmware_version = self._read_firmware_version()
         self.check_firmware_version_supported()
 
         self._positions: List[float] = [0.0] * 12
@@ -71,7 +72,17 @@ class SRV4ServoBoardHardwareBackend(
         """
         The firmware version reported by the board.
 
+        Cached at initialisation.
+
         :returns: firmware version reported by the board, if any.
+        """
+        return self._firmware_version
+
+    def _read_firmware_version(self) -> str:
+        """
+        Read the firmware version from the board.
+
+        :returns: firmware version reported by the board.
         :raises CommunicationError: servo board is not responding.
         """
         try:
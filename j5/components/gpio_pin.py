@@ -2,7 +2,7 @@
 
 from abc import abstractmethod
 from enum import IntEnum
-from typing import Set, Type, Union
+from typing import AbstractSet, FrozenSet, Set, Type, Union
 
 from j5.components.component import (
     Component,
@@ -37,6 +37,15 @@ FirmwareMode = Type[DerivedComponent]
 
 PinMode = Union[FirmwareMode, GPIOPinMode]
 
+# Modes required by each pin operation, built once rather than on every call.
+_DIGITAL_OUTPUT_MODES: FrozenSet[PinMode] = frozenset({GPIOPinMode.DIGITAL_OUTPUT})
+_DIGITAL_INPUT_MODES: FrozenSet[PinMode] = frozenset(
+    {GPIOPinMode.DIGITAL_INPUT, GPIOPinMode.DIGITAL_INPUT_PULLUP, GPIOPinMode.DIGITAL_INPUT_PULLDOWN},
+)
+_ANALOGUE_INPUT_MODES: FrozenSet[PinMode] = frozenset({GPIOPinMode.ANALOGUE_INPUT})
+_ANALOGUE_OUTPUT_MODES: FrozenSet[PinMode] = frozenset({GPIOPinMode.ANALOGUE_OUTPUT})
+_PWM_OUTPUT_MODES: FrozenSet[PinMode] = frozenset({GPIOPinMode.PWM_OUTPUT})
+
 
 class GPIOPinInterface(Interface):
     """An interface containing the methods required for a GPIO Pin."""
@@ -150,7 +159,7 @@ class GPIOPin(Component):
         backend: GPIOPinInterface,
         *,
         initial_mode: PinMode,
-        hardware_modes: Set[GPIOPinMode] = DEFAULT_HW_MODE,
+        hardware_modes: AbstractSet[GPIOPinMode] = DEFAULT_HW_MODE,
         firmware_modes: Set[FirmwareMode] = DEFAULT_FW_MODE,
     ) -> None:
         self._backend = backend
@@ -172,14 +181,16 @@ class GPIOPin(Component):
         """
         return GPIOPinInterface
 
-    def _require_pin_modes(self, pin_modes: Set[PinMode]) -> None:
+    def _require_pin_modes(self, pin_modes: AbstractSet[PinMode]) -> None:
         """
         Ensure that this pin is in the specified hardware mode.
 
+        An empty set of modes allows any mode, and skips querying the backend.
+
         :param pin_modes: set of valid pin modes.
         :raises BadGPIOPinModeError: pin not in a valid mode.
         """
-        if self.mode not in pin_modes and not len(pin_modes) == 0:
+        if pin_modes and self.mode not in pin_modes:
             raise BadGPIOPinModeError(
                 f"Pin {self._identifier} needs to be in one of {pin_modes}",
             )
@@ -210,7 +221,7 @@ class GPIOPin(Component):
         :param pin_mode: mode to switch to.
         :raises NotSupportedByComponentError: pin doesn't support mode.
         """
-        if pin_mode not in self._supported_modes | self._firmware_modes:
+        if pin_mode not in self._supported_modes and pin_mode not in self._firmware_modes:
             raise NotSupportedByComponentError(
                 f"Pin {self._identifier} does not support {str(pin_mode)}.",
             )
@@ -223,7 +234,7 @@ class GPIOPin(Component):
 
         :param state: digital state.
         """
-        self._require_pin_modes({GPIOPinMode.DIGITAL_OUTPUT})
+        self._require_pin_modes(_DIGITAL_OUTPUT_MODES)
         self._backend.write_gpio_pin_digital_state(self._identifier, state)
 
     @property
@@ -236,7 +247,7 @@ class GPIOPin(Component):
 
         :returns: last set digital state of the pin
         """
-        self._require_pin_modes({GPIOPinMode.DIGITAL_OUTPUT})
+        self._require_pin_modes(_DIGITAL_OUTPUT_MODES)
         return self._backend.get_gpio_pin_digital_state(self._identifier)
 
     def digital_read(self) -> bool:
@@ -245,9 +256,7 @@ class GPIOPin(Component):
 
         :returns: digital read state of the pin.
         """
-        self._require_pin_modes(
-            {GPIOPinMode.DIGITAL_INPUT, GPIOPinMode.DIGITAL_INPUT_PULLUP, GPIOPinMode.DIGITAL_INPUT_PULLDOWN},
-        )
+        self._require_pin_modes(_DIGITAL_INPUT_MODES)
 
         return self._backend.read_gpio_pin_digital_state(self._identifier)
 
@@ -257,7 +266,7 @@ class GPIOPin(Component):
 
         :returns: scaled analogue reading
         """
-        self._require_pin_modes({GPIOPinMode.ANALOGUE_INPUT})
+        self._require_pin_modes(_ANALOGUE_INPUT_MODES)
         return self._backend.read_gpio_pin_analogue_value(self._identifier)
 
     def analogue_write(self, new_value: float) -> None:
@@ -267,11 +276,7 @@ class GPIOPin(Component):
         :param new_value: analogue value
         :raises ValueError: pin value must be between 0 and 1
         """
-        self._require_pin_modes(
-            {
-                GPIOPinMode.ANALOGUE_OUTPUT,
-            }
-        )
+        self._require_pin_modes(_ANALOGUE_OUTPUT_MODES)
         if new_value < 0 or new_value > 1:
             raise ValueError("An analogue pin value must be between 0 and 1.")
 
@@ -287,11 +292,7 @@ class GPIOPin(Component):
         :param new_value: new duty cycle
         :raises ValueError: pin value must be between 0 and 1
         """
-        self._require_pin_modes(
-            {
-                GPIOPinMode.PWM_OUTPUT,
-            }
-        )
+        self._require_pin_modes(_PWM_OUTPUT_MODES)
         if new_value < 0 or new_value > 1:
             raise ValueError("An PWM pin value must be between 0 and 1.")
 
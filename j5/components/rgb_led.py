@@ -2,7 +2,7 @@
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Tuple, Type, Union
+from typing import Dict, Tuple, Type, Union
 
 from j5.components.component import Component, Interface
 
@@ -15,6 +15,10 @@ class RGBColour(Enum):
     BLUE = "blue"
 
 
+# Map channel names straight to members, rather than going through the Enum constructor.
+_COLOURS_BY_NAME: Dict[str, RGBColour] = {colour.value: colour for colour in RGBColour}
+
+
 class RGBLEDInterface(Interface):
     """An interface containing the methods required to control a RGB LED."""
 
@@ -79,6 +83,24 @@ class RGBLED(Component):
         """
         return self._identifier
 
+    @staticmethod
+    def _parse_channel(channel: Union[str, RGBColour]) -> RGBColour:
+        """
+        Convert a channel name or enum member to an RGBColour.
+
+        :param channel: The channel name, in any case, or an RGBColour.
+        :returns: The matching RGBColour.
+        :raises ValueError: channel is not a valid RGB channel.
+        """
+        if not isinstance(channel, str):
+            return channel
+        try:
+            return _COLOURS_BY_NAME[channel.lower()]
+        except KeyError:
+            raise ValueError(
+                f"{channel} is not a RGB colour, choose from: " "red, green, blue",
+            ) from None
+
     def get_channel(self, channel: Union[str, RGBColour]) -> float:
         """
         Get the current value of a channel.
@@ -87,16 +109,7 @@ class RGBLED(Component):
         :returns: The duty cycle for the channel.
         :raises ValueError: channel is not a valid RGB channel.
         """
-        if isinstance(channel, str):
-            try:
-                colour = RGBColour(channel.lower())
-            except ValueError:
-                raise ValueError(
-                    f"{channel} is not a RGB colour, choose from: " "red, green, blue",
-                ) from None
-        else:
-            colour = channel
-
+        colour = self._parse_channel(channel)
         return self._backend.get_rgb_led_channel_duty_cycle(self._identifier, colour)
 
     def set_channel(self, channel: Union[str, RGBColour], duty_cycle: float) -> None:
@@ -108,15 +121,7 @@ class RGBLED(Component):
         :raises ValueError: channel is not a valid RGB channel.
         :raises ValueError: duty cycle is not in expected range.
         """
-        if isinstance(channel, str):
-            try:
-                colour = RGBColour(channel.lower())
-            except ValueError:
-                raise ValueError(
-                    f"{channel} is not a RGB colour, choose from: " "red, green, blue",
-                ) from None
-        else:
-            colour = channel
+        colour = self._parse_channel(channel)
 
         if duty_cycle < 0 or duty_cycle > 1:
             raise ValueError("PWM LED duty cycle must be between 0 and 1")
@@ -47,7 +47,7 @@ def test_backend_get_motor_state() -> None:
     """Test that we can get the motor states."""
     backend = SRV4MotorBoardConsoleBackend("TestBoard")
 
-    for i in range(0, 2):
+    for i in range(2):
         assert backend.get_motor_state(i) == MotorSpecialState.BRAKE
         backend._state[i] = 0.0
         assert backend.get_motor_state(i) == 0.0
@@ -84,6 +84,6 @@ def test_backend_set_motor_state_out_of_range() -> None:
         "TestBoard",
         console_class=MockConsole,
     )
-    with pytest.raises(ValueError):
-        backend._console.expects = "Setting motor 10 to -1.0."  # type: ignore
+    backend._console.expects = "Setting motor 10 to -1.0."  # type: ignore
+    with pytest.raises(ValueError, match="Invalid motor identifier: 10"):
         backend.set_motor_state(10, -1.0)
@@ -50,7 +50,7 @@ def test_backend_get_power_output_enabled() -> None:
     """Test that we can read the enable status of a PowerOutput."""
     backend = SRV4PowerBoardConsoleBackend("TestBoard")
 
-    for i in range(0, 7):
+    for i in range(7):
         assert not backend.get_power_output_enabled(i)
 
     with pytest.raises(ValueError):
@@ -64,12 +64,12 @@ def test_backend_set_power_output_enabled() -> None:
         console_class=MockConsole,
     )
 
-    for i in range(0, 7):
+    for i in range(7):
         backend._console.expects = f"Setting output {i} to True"  # type: ignore
         backend.set_power_output_enabled(i, True)
 
-    with pytest.raises(ValueError):
-        backend._console.expects = "Setting output 7 to True"  # type: ignore
+    backend._console.expects = "Setting output 7 to True"  # type: ignore
+    with pytest.raises(ValueError, match="Invalid power output identifier 7"):
         backend.set_power_output_enabled(7, True)
 
 
@@ -80,7 +80,7 @@ def test_backend_get_power_output_current() -> None:
         console_class=MockConsole,
     )
 
-    for i in range(0, 7):
+    for i in range(7):
         backend._console.next_input = "1.2"  # type: ignore
         assert 1.2 == backend.get_power_output_current(i)
 
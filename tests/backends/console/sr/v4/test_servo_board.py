@@ -47,7 +47,7 @@ def test_backend_set_servo_pos() -> None:
     """Test the we can get the servo positions."""
     backend = SRV4ServoBoardConsoleBackend("TestBoard")
 
-    for i in range(0, 12):
+    for i in range(12):
         assert backend.get_servo_position(i) is None
         backend._positions[i] = 0.0
         assert backend.get_servo_position(i) == 0.0
@@ -81,6 +81,6 @@ def test_backend_set_servo_pos_out_of_range() -> None:
         "TestBoard",
         console_class=MockConsole,
     )
-    with pytest.raises(ValueError):
-        backend._console.expects = "Setting servo 10 to -1.0."  # type: ignore
+    backend._console.expects = "Setting servo 10 to -1.0."  # type: ignore
+    with pytest.raises(ValueError, match="Invalid servo identifier: 18"):
         backend.set_servo_position(18, -1.0)
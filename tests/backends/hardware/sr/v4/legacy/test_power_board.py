@@ -240,7 +240,7 @@ class MockSRV4LegacyPowerBoardHardwareBackend(SRV4LegacyPowerBoardHardwareBacken
         assert idVendor == 0x1BDA
         assert idProduct == 0x0010
         assert find_all
-        return [MockUSBPowerBoardDevice(f"SERIAL{n}") for n in range(0, 4)]
+        return [MockUSBPowerBoardDevice(f"SERIAL{n}") for n in range(4)]
 
 
 def test_backend_initialisation() -> None:
@@ -281,6 +281,15 @@ def test_backend_firmware_version() -> None:
     assert backend.firmware_version == "3"
 
 
+def test_backend_firmware_version_cached() -> None:
+    """Test that the firmware version is cached."""
+    device = MockUSBPowerBoardDevice("SERIAL0")
+    backend = SRV4LegacyPowerBoardHardwareBackend(device)
+
+    device.firmware_version = 4
+    assert backend.firmware_version == "3"
+
+
 def test_backend_bad_firmware_version() -> None:
     """Test that we can get the firmware version."""
     device = MockUSBPowerBoardDevice("SERIAL0", fw_version=2)
@@ -301,7 +310,7 @@ def test_backend_get_power_output_enabled() -> None:
     device = MockUSBPowerBoardDevice("SERIAL0")
     backend = SRV4LegacyPowerBoardHardwareBackend(device)
 
-    for i in range(0, 6):
+    for i in range(6):
         assert not backend.get_power_output_enabled(i)
 
     with pytest.raises(ValueError):
@@ -313,7 +322,7 @@ def test_backend_set_power_output_enabled() -> None:
     device = MockUSBPowerBoardDevice("SERIAL0")
     backend = SRV4LegacyPowerBoardHardwareBackend(device)
 
-    for i in range(0, 6):
+    for i in range(6):
         backend.set_power_output_enabled(i, True)
 
     with pytest.raises(ValueError):
@@ -325,7 +334,7 @@ def test_backend_get_power_output_current() -> None:
     device = MockUSBPowerBoardDevice("SERIAL0")
     backend = SRV4LegacyPowerBoardHardwareBackend(device)
 
-    for i in range(0, 6):
+    for i in range(6):
         assert 1.2 == backend.get_power_output_current(i)
 
     with pytest.raises(ValueError):
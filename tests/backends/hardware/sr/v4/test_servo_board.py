@@ -37,7 +37,7 @@ def test_cmd_write_init() -> None:
 
 def test_cmd_write_servo() -> None:
     """Test the CMD_WRITE_SERVO command are as expected."""
-    for i in range(0, 12):
+    for i in range(12):
         assert CMD_WRITE_SET_SERVO[i].code == i
 
 
@@ -183,7 +183,7 @@ class MockSRV4ServoBoardHardwareBackend(SRV4ServoBoardHardwareBackend):
         assert idVendor == 0x1BDA
         assert idProduct == 0x0011
         assert find_all
-        return [MockUSBServoBoardDevice(f"SERIAL{n}") for n in range(0, 4)]
+        return [MockUSBServoBoardDevice(f"SERIAL{n}") for n in range(4)]
 
 
 class MockErrorSRV4ServoBoardHardwareBackend(SRV4ServoBoardHardwareBackend):
@@ -246,6 +246,15 @@ def test_backend_firmware_version() -> None:
     assert backend.firmware_version == "2"
 
 
+def test_backend_firmware_version_cached() -> None:
+    """Test that the firmware version is cached."""
+    device = MockUSBServoBoardDevice("SERIAL0")
+    backend = SRV4ServoBoardHardwareBackend(device)
+
+    device.firmware_version = 3
+    assert backend.firmware_version == "2"
+
+
 def test_backend_bad_firmware_version() -> None:
     """Test that we can get the firmware version."""
     device = MockUSBServoBoardDevice("SERIAL0", fw_version=1)
@@ -25,7 +25,7 @@ class MockMotorBoardBackend(MotorInterface, Backend):
         return set()
 
     def __init__(self) -> None:
-        self._states: List[MotorState] = [MotorSpecialState.BRAKE for _ in range(0, 2)]
+        self._states: List[MotorState] = [MotorSpecialState.BRAKE] * 2
 
     @property
     def firmware_version(self) -> Optional[str]:
@@ -1,6 +1,6 @@
 """Tests for the SR v4 Power Board and related classes."""
 from datetime import timedelta
-from typing import TYPE_CHECKING, Optional, Set
+from typing import Optional, Set
 
 import pytest
 
@@ -21,9 +21,6 @@ from j5.components import (
 )
 from j5.components.piezo import Pitch
 
-if TYPE_CHECKING:
-    from j5.boards import Board  # noqa
-
 
 class MockPowerBoardBackend(
     PowerOutputInterface,
@@ -39,12 +39,14 @@ def test_battery_sensor_identifier() -> None:
 def test_battery_sensor_voltage() -> None:
     """Test that we can get the voltage of a battery sensor."""
     battery = BatterySensor(0, MockBatterySensorDriver())
-    assert type(battery.voltage) is float
-    assert battery.voltage == 5.0
+    voltage = battery.voltage
+    assert isinstance(voltage, float)
+    assert voltage == 5.0
 
 
 def test_battery_sensor_current() -> None:
     """Test that we can get the current of a battery sensor."""
     battery = BatterySensor(0, MockBatterySensorDriver())
-    assert type(battery.current) is float
-    assert battery.current == 2.0
+    current = battery.current
+    assert isinstance(current, float)
+    assert current == 2.0
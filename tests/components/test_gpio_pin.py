@@ -1,5 +1,6 @@
 """Tests for the GPIO Pin Classes."""
-from typing import List, Type
+from contextlib import nullcontext
+from typing import ContextManager, FrozenSet, List, Optional, Set, Type
 
 import pytest
 
@@ -15,17 +16,55 @@ from j5.components.gpio_pin import (
     GPIOPinMode,
 )
 
+DIGITAL_IO_MODES: FrozenSet[GPIOPinMode] = frozenset(
+    {
+        GPIOPinMode.DIGITAL_OUTPUT,
+        GPIOPinMode.DIGITAL_INPUT,
+    },
+)
+OUTPUT_AND_NON_PULLDOWN_INPUT_MODES: FrozenSet[GPIOPinMode] = frozenset(
+    {
+        GPIOPinMode.DIGITAL_OUTPUT,
+        GPIOPinMode.DIGITAL_INPUT,
+        GPIOPinMode.DIGITAL_INPUT_PULLUP,
+        GPIOPinMode.ANALOGUE_INPUT,
+    },
+)
+OUTPUT_AND_ALL_INPUT_MODES: FrozenSet[GPIOPinMode] = frozenset(
+    {
+        GPIOPinMode.DIGITAL_OUTPUT,
+        GPIOPinMode.DIGITAL_INPUT,
+        GPIOPinMode.DIGITAL_INPUT_PULLUP,
+        GPIOPinMode.DIGITAL_INPUT_PULLDOWN,
+        GPIOPinMode.ANALOGUE_INPUT,
+    },
+)
+ANALOGUE_OUTPUT_MODES: FrozenSet[GPIOPinMode] = frozenset(
+    {
+        GPIOPinMode.ANALOGUE_OUTPUT,
+        GPIOPinMode.PWM_OUTPUT,
+    },
+)
+
 
 class MockGPIOPinDriver(GPIOPinInterface):
     """A testing driver for the GPIO pin component."""
 
     def __init__(self) -> None:
         self.pin_count: int = 10
-        self._mode: List[GPIOPinMode] = [GPIOPinMode.DIGITAL_OUTPUT for _ in range(0, self.pin_count)]
+        self._mode: List[GPIOPinMode] = [GPIOPinMode.DIGITAL_OUTPUT] * self.pin_count
 
-        self._written_digital_state: List[bool] = [False for _ in range(0, self.pin_count)]
+        # Digital states are packed into bitmasks, one bit per pin.
+        self._written_digital_state: int = 0
+        self._digital_state: int = 0
 
-        self._digital_state: List[bool] = [False for _ in range(0, self.pin_count)]
+    def toggle_written_digital_state(self, identifier: int) -> None:
+        """Invert the last written digital state of a pin."""
+        self._written_digital_state ^= 1 << identifier
+
+    def toggle_digital_state(self, identifier: int) -> None:
+        """Invert the digital state that will be read from a pin."""
+        self._digital_state ^= 1 << identifier
 
     def set_gpio_pin_mode(self, identifier: int, pin_mode: GPIOPinMode) -> None:
         """Set the hardware mode of a pin."""
@@ -37,15 +76,16 @@ class MockGPIOPinDriver(GPIOPinInterface):
 
     def write_gpio_pin_digital_state(self, identifier: int, state: bool) -> None:
         """Write to the digital state of a GPIO pin."""
-        self._written_digital_state[identifier] = state
+        mask = 1 << identifier
+        self._written_digital_state = (self._written_digital_state & ~mask) | (mask if state else 0)
 
     def get_gpio_pin_digital_state(self, identifier: int) -> bool:
         """Get the last written state of the GPIO pin."""
-        return self._written_digital_state[identifier]
+        return bool(self._written_digital_state >> identifier & 1)
 
     def read_gpio_pin_digital_state(self, identifier: int) -> bool:
         """Read the digital state of the GPIO pin."""
-        return self._digital_state[identifier]
+        return bool(self._digital_state >> identifier & 1)
 
     def read_gpio_pin_analogue_value(self, identifier: int) -> float:
         """Read the scaled analogue value of the GPIO pin."""
@@ -68,14 +108,20 @@ class MockGPIOPinDriver(GPIOPinInterface):
         pass
 
 
+@pytest.fixture
+def gpio_driver() -> MockGPIOPinDriver:
+    """A fresh GPIO pin driver in its initial state."""
+    return MockGPIOPinDriver()
+
+
 def test_gpio_pin_interface_implementation() -> None:
     """Test that we can implement the GPIO pin interface."""
     MockGPIOPinDriver()
 
 
-def test_gpio_pin_instantiation() -> None:
+def test_gpio_pin_instantiation(gpio_driver: MockGPIOPinDriver) -> None:
     """Test that we can instantiate a GPIO pin."""
-    GPIOPin(0, MockGPIOPinDriver(), initial_mode=GPIOPinMode.DIGITAL_OUTPUT)
+    GPIOPin(0, gpio_driver, initial_mode=GPIOPinMode.DIGITAL_OUTPUT)
 
 
 def test_gpio_pin_interface_class() -> None:
@@ -83,113 +129,98 @@ def test_gpio_pin_interface_class() -> None:
     assert GPIOPin.interface_class() is GPIOPinInterface
 
 
-def test_gpio_pin_identifier() -> None:
+def test_gpio_pin_identifier(gpio_driver: MockGPIOPinDriver) -> None:
     """Test the identifier attribute of the component."""
-    component = GPIOPin(0, MockGPIOPinDriver(), initial_mode=GPIOPinMode.DIGITAL_OUTPUT)
+    component = GPIOPin(0, gpio_driver, initial_mode=GPIOPinMode.DIGITAL_OUTPUT)
     assert component.identifier == 0
 
 
-def test_pin_mode_getter() -> None:
+def test_pin_mode_getter(gpio_driver: MockGPIOPinDriver) -> None:
     """Test the mode getter."""
-    driver = MockGPIOPinDriver()
-
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.DIGITAL_INPUT,
-        hardware_modes={GPIOPinMode.DIGITAL_INPUT, GPIOPinMode.DIGITAL_OUTPUT},
+        hardware_modes=DIGITAL_IO_MODES,
     )
 
     assert pin.mode is GPIOPinMode.DIGITAL_INPUT
-    driver._mode[0] = GPIOPinMode.DIGITAL_OUTPUT
+    gpio_driver._mode[0] = GPIOPinMode.DIGITAL_OUTPUT
     assert pin.mode is GPIOPinMode.DIGITAL_OUTPUT
 
 
-def test_pin_mode_setter() -> None:
+def test_pin_mode_setter(gpio_driver: MockGPIOPinDriver) -> None:
     """Test the setter for the pin mode."""
-    driver = MockGPIOPinDriver()
-
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.DIGITAL_INPUT,
-        hardware_modes={GPIOPinMode.DIGITAL_INPUT, GPIOPinMode.DIGITAL_OUTPUT},
+        hardware_modes=DIGITAL_IO_MODES,
     )
 
-    assert driver._mode[0] is GPIOPinMode.DIGITAL_INPUT
+    assert gpio_driver._mode[0] is GPIOPinMode.DIGITAL_INPUT
     pin.mode = GPIOPinMode.DIGITAL_OUTPUT
-    assert driver._mode[0] is GPIOPinMode.DIGITAL_OUTPUT
+    assert gpio_driver._mode[0] is GPIOPinMode.DIGITAL_OUTPUT
 
     with pytest.raises(NotSupportedByComponentError):
         pin.mode = GPIOPinMode.ANALOGUE_INPUT
 
 
-def test_initial_mode() -> None:
+@pytest.mark.parametrize(
+    "identifier,initial_mode,hardware_modes,expected_error",
+    [
+        (0, GPIOPinMode.DIGITAL_OUTPUT, None, None),
+        (2, GPIOPinMode.DIGITAL_OUTPUT, None, None),
+        (2, GPIOPinMode.DIGITAL_INPUT, {GPIOPinMode.DIGITAL_INPUT}, None),
+        (2, GPIOPinMode.DIGITAL_INPUT, None, NotSupportedByComponentError),
+        (2, GPIOPinMode.DIGITAL_INPUT, {GPIOPinMode.DIGITAL_OUTPUT}, NotSupportedByComponentError),
+    ],
+    ids=[
+        "implicit-default-modes",
+        "explicit-default-modes",
+        "explicit-specified-modes",
+        "unsupported-default-modes",
+        "unsupported-specified-modes",
+    ],
+)
+def test_initial_mode(
+    gpio_driver: MockGPIOPinDriver,
+    identifier: int,
+    initial_mode: GPIOPinMode,
+    hardware_modes: Optional[Set[GPIOPinMode]],
+    expected_error: Optional[Type[Exception]],
+) -> None:
     """Test that the initial mode of the pin is set correctly."""
-    driver = MockGPIOPinDriver()
+    context: ContextManager[object] = nullcontext() if expected_error is None else pytest.raises(expected_error)
 
-    # Implicit initial mode with default supported modes
-    GPIOPin(0, driver, initial_mode=GPIOPinMode.DIGITAL_OUTPUT)
-    assert driver._mode[0] is GPIOPinMode.DIGITAL_OUTPUT
+    with context:
+        if hardware_modes is None:
+            GPIOPin(identifier, gpio_driver, initial_mode=initial_mode)
+        else:
+            GPIOPin(identifier, gpio_driver, initial_mode=initial_mode, hardware_modes=hardware_modes)
 
-    # Explicit initial mode with default supported modes
-    GPIOPin(
-        2,
-        driver,
-        initial_mode=GPIOPinMode.DIGITAL_OUTPUT,
-    )
-    assert driver._mode[2] is GPIOPinMode.DIGITAL_OUTPUT
+    if expected_error is None:
+        assert gpio_driver._mode[identifier] is initial_mode
 
-    # Explicit initial mode with specified supported modes
-    GPIOPin(
-        2,
-        driver,
-        initial_mode=GPIOPinMode.DIGITAL_INPUT,
-        hardware_modes={GPIOPinMode.DIGITAL_INPUT},
-    )
-    assert driver._mode[2] is GPIOPinMode.DIGITAL_INPUT
 
-    # Unsupported explicit initial mode with default supported modes
-    with pytest.raises(NotSupportedByComponentError):
-        GPIOPin(
-            2,
-            driver,
-            initial_mode=GPIOPinMode.DIGITAL_INPUT,
-        )
-    # Unsupported explicit initial mode with specified supported modes
-    with pytest.raises(NotSupportedByComponentError):
-        GPIOPin(
-            2,
-            driver,
-            initial_mode=GPIOPinMode.DIGITAL_INPUT,
-            hardware_modes={GPIOPinMode.DIGITAL_OUTPUT},
-        )
-
-
-def test_supported_modes_length() -> None:
+def test_supported_modes_length(gpio_driver: MockGPIOPinDriver) -> None:
     """Test that a pin cannot be created with zero supported modes."""
-    driver = MockGPIOPinDriver()
-
     with pytest.raises(ValueError):
         GPIOPin(
             0,
-            driver,
+            gpio_driver,
             initial_mode=GPIOPinMode.DIGITAL_INPUT,
             hardware_modes=set(),
         )
 
 
-def test_required_pin_modes() -> None:
+def test_required_pin_modes(gpio_driver: MockGPIOPinDriver) -> None:
     """Test the runtime check for required pin modes."""
-    driver = MockGPIOPinDriver()
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.DIGITAL_OUTPUT,
-        hardware_modes={
-            GPIOPinMode.DIGITAL_OUTPUT,
-            GPIOPinMode.DIGITAL_INPUT,
-        },
+        hardware_modes=DIGITAL_IO_MODES,
     )
 
     # 0
@@ -210,27 +241,20 @@ def test_required_pin_modes() -> None:
     )
 
 
-def test_digital_state_getter() -> None:
+def test_digital_state_getter(gpio_driver: MockGPIOPinDriver) -> None:
     """Test that we can get the digital state correctly."""
-    driver = MockGPIOPinDriver()
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.DIGITAL_INPUT,
-        hardware_modes={
-            GPIOPinMode.DIGITAL_OUTPUT,
-            GPIOPinMode.DIGITAL_INPUT,
-            GPIOPinMode.DIGITAL_INPUT_PULLUP,
-            GPIOPinMode.DIGITAL_INPUT_PULLDOWN,
-            GPIOPinMode.ANALOGUE_INPUT,
-        },
+        hardware_modes=OUTPUT_AND_ALL_INPUT_MODES,
     )
 
     # Digital Output
     pin.mode = GPIOPinMode.DIGITAL_OUTPUT
-    assert pin.last_digital_write is driver._written_digital_state[0]
-    driver._written_digital_state[0] = not driver._written_digital_state[0]
-    assert pin.last_digital_write is driver._written_digital_state[0]
+    assert pin.last_digital_write is False
+    gpio_driver.toggle_written_digital_state(0)
+    assert pin.last_digital_write is True
 
     with pytest.raises(BadGPIOPinModeError):
         _ = pin.digital_read()
@@ -242,9 +266,10 @@ def test_digital_state_getter() -> None:
         GPIOPinMode.DIGITAL_INPUT_PULLDOWN,
     ]:
         pin.mode = mode
-        assert pin.digital_read() is driver._digital_state[0]
-        driver._digital_state[0] = not driver._digital_state[0]
-        assert pin.digital_read() is driver._digital_state[0]
+        state = gpio_driver.read_gpio_pin_digital_state(0)
+        assert pin.digital_read() is state
+        gpio_driver.toggle_digital_state(0)
+        assert pin.digital_read() is not state
 
     # Analogue
     pin.mode = GPIOPinMode.ANALOGUE_INPUT
@@ -252,76 +277,67 @@ def test_digital_state_getter() -> None:
         _ = pin.last_digital_write
 
 
-def test_digital_state_setter() -> None:
+def test_digital_state_setter(gpio_driver: MockGPIOPinDriver) -> None:
     """Test that we can set the digital state."""
-    driver = MockGPIOPinDriver()
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.DIGITAL_INPUT,
-        hardware_modes={
-            GPIOPinMode.DIGITAL_OUTPUT,
-            GPIOPinMode.DIGITAL_INPUT,
-            GPIOPinMode.DIGITAL_INPUT_PULLUP,
-            GPIOPinMode.ANALOGUE_INPUT,
-        },
+        hardware_modes=OUTPUT_AND_NON_PULLDOWN_INPUT_MODES,
     )
 
     pin.mode = GPIOPinMode.DIGITAL_OUTPUT
     pin.digital_write(True)
-    assert driver._written_digital_state[0]
+    assert gpio_driver.get_gpio_pin_digital_state(0)
     pin.digital_write(False)
-    assert not driver._written_digital_state[0]
+    assert not gpio_driver.get_gpio_pin_digital_state(0)
 
 
-def test_analogue_value_getter() -> None:
+def test_analogue_value_getter(gpio_driver: MockGPIOPinDriver) -> None:
     """Test that we can get a scaled analogue value."""
-    driver = MockGPIOPinDriver()
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.DIGITAL_INPUT,
-        hardware_modes={
-            GPIOPinMode.DIGITAL_OUTPUT,
-            GPIOPinMode.DIGITAL_INPUT,
-            GPIOPinMode.DIGITAL_INPUT_PULLUP,
-            GPIOPinMode.ANALOGUE_INPUT,
-        },
+        hardware_modes=OUTPUT_AND_NON_PULLDOWN_INPUT_MODES,
     )
     pin.mode = GPIOPinMode.ANALOGUE_INPUT
     assert pin.analogue_read() == 0.6
 
-    with pytest.raises(BadGPIOPinModeError):
-        pin.mode = GPIOPinMode.DIGITAL_OUTPUT
+    pin.mode = GPIOPinMode.DIGITAL_OUTPUT
+    with pytest.raises(BadGPIOPinModeError, match="Pin 0 needs to be in one of"):
         _ = pin.analogue_read()
 
 
-def test_analogue_value_setter() -> None:
-    """Test that we can set a scaled analogue value."""
-    driver = MockGPIOPinDriver()
-    pin = GPIOPin(
+@pytest.fixture
+def analogue_output_pin(gpio_driver: MockGPIOPinDriver) -> GPIOPin:
+    """A GPIO pin in analogue output mode."""
+    return GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.ANALOGUE_OUTPUT,
-        hardware_modes={
-            GPIOPinMode.ANALOGUE_OUTPUT,
-            GPIOPinMode.PWM_OUTPUT,
-        },
+        hardware_modes=ANALOGUE_OUTPUT_MODES,
     )
 
-    pin.mode = GPIOPinMode.ANALOGUE_OUTPUT
-    pin.analogue_write(0.6)
 
+@pytest.mark.parametrize("value", [0, 0.0, 0.6, 1, 1.0])
+def test_analogue_value_setter(analogue_output_pin: GPIOPin, value: float) -> None:
+    """Test that we can set a scaled analogue value."""
+    analogue_output_pin.analogue_write(value)
+
+
+@pytest.mark.parametrize("value", [-1, -0.000001, 1.000001, 2, float("inf"), float("-inf")])
+def test_analogue_value_setter_out_of_bounds(analogue_output_pin: GPIOPin, value: float) -> None:
+    """Test that an error is thrown when the analogue value is out of bounds."""
     with pytest.raises(ValueError):
-        pin.analogue_write(-1)
+        analogue_output_pin.analogue_write(value)
 
 
-def test_pwm_value_setter() -> None:
+def test_pwm_value_setter(gpio_driver: MockGPIOPinDriver) -> None:
     """Test that we can set a scaled PWM value."""
-    driver = MockGPIOPinDriver()
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.PWM_OUTPUT,
         hardware_modes={
             GPIOPinMode.PWM_OUTPUT,
@@ -335,47 +351,45 @@ def test_pwm_value_setter() -> None:
         pin.pwm_write(-1)
 
 
-class Peripheral(DerivedComponent):
-    """A mock derived component."""
+@pytest.fixture
+def peripheral() -> Type[DerivedComponent]:
+    """A mock derived component, only defined for the tests that use it."""
 
-    @staticmethod
-    def interface_class() -> Type[Interface]:
-        """Return an interface."""
-        return Interface
+    class Peripheral(DerivedComponent):
+        """A mock derived component."""
 
+        @staticmethod
+        def interface_class() -> Type[Interface]:
+            """Return an interface."""
+            return Interface
 
-def test_derived_mode_is_possible() -> None:
+    return Peripheral
+
+
+def test_derived_mode_is_possible(gpio_driver: MockGPIOPinDriver, peripheral: Type[DerivedComponent]) -> None:
     """Check that it is possible to support a derived component."""
-    driver = MockGPIOPinDriver()
     GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.ANALOGUE_OUTPUT,
-        hardware_modes={
-            GPIOPinMode.ANALOGUE_OUTPUT,
-            GPIOPinMode.PWM_OUTPUT,
-        },
+        hardware_modes=ANALOGUE_OUTPUT_MODES,
         firmware_modes={
-            Peripheral,
+            peripheral,
         },
     )
 
 
-def test_firmware_mode_setter() -> None:
+def test_firmware_mode_setter(gpio_driver: MockGPIOPinDriver, peripheral: Type[DerivedComponent]) -> None:
     """Test that the firmware mode of a pin can be set after instantation."""
-    driver = MockGPIOPinDriver()
     pin = GPIOPin(
         0,
-        driver,
+        gpio_driver,
         initial_mode=GPIOPinMode.ANALOGUE_OUTPUT,
-        hardware_modes={
-            GPIOPinMode.ANALOGUE_OUTPUT,
-            GPIOPinMode.PWM_OUTPUT,
-        },
+        hardware_modes=ANALOGUE_OUTPUT_MODES,
     )
 
-    assert Peripheral not in pin.firmware_modes
+    assert peripheral not in pin.firmware_modes
 
-    pin.firmware_modes = {Peripheral}
+    pin.firmware_modes = {peripheral}
 
-    assert Peripheral in pin.firmware_modes
+    assert peripheral in pin.firmware_modes
@@ -1,4 +1,6 @@
 """Tests for the LED Classes."""
+import pytest
+
 from j5.components.led import LED, LEDInterface
 
 
@@ -14,25 +16,31 @@ class MockLEDDriver(LEDInterface):
         return True
 
 
+@pytest.fixture(scope="module")
+def led_driver() -> MockLEDDriver:
+    """A stateless LED driver, shared by the tests in this module."""
+    return MockLEDDriver()
+
+
 def test_led_interface_implementation() -> None:
     """Test that we can implement the LEDInterface."""
     MockLEDDriver()
 
 
-def test_led_instantiation() -> None:
+def test_led_instantiation(led_driver: MockLEDDriver) -> None:
     """Test that we can instantiate an LED."""
-    LED(0, MockLEDDriver())
+    LED(0, led_driver)
 
 
-def test_led_identifier() -> None:
+def test_led_identifier(led_driver: MockLEDDriver) -> None:
     """Test the identifier attribute of the component."""
-    component = LED(0, MockLEDDriver())
+    component = LED(0, led_driver)
     assert component.identifier == 0
 
 
-def test_led_state() -> None:
+def test_led_state(led_driver: MockLEDDriver) -> None:
     """Test the state property of an LED."""
-    led = LED(0, MockLEDDriver())
+    led = LED(0, led_driver)
 
     led.state = True
     assert led.state
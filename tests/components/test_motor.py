@@ -1,5 +1,5 @@
 """Tests for the motor classes."""
-from typing import Mapping
+from typing import Mapping, Type
 
 import pytest
 
@@ -10,6 +10,13 @@ from j5.components.motor import (
     MotorState,
 )
 
+TEST_MOTOR_STATES: Mapping[int, MotorState] = {
+    0: 0.0,
+    1: 0.5,
+    2: MotorSpecialState.COAST,
+    3: MotorSpecialState.BRAKE,
+}
+
 
 class MockMotorDriver(MotorInterface):
     """A testing driver for motors."""
@@ -20,19 +27,25 @@ class MockMotorDriver(MotorInterface):
 
         As this is a testing function, the state is actually dependent on the identifier.
         """
-        test_states: Mapping[int, MotorState] = {
-            0: 0.0,
-            1: 0.5,
-            2: MotorSpecialState.COAST,
-            3: MotorSpecialState.BRAKE,
-        }
-        return test_states[identifier]
+        return TEST_MOTOR_STATES[identifier]
 
     def set_motor_state(self, identifier: int, power: MotorState) -> None:
         """Set the state of the motor."""
         pass
 
 
+@pytest.fixture(scope="module")
+def motor_driver() -> MockMotorDriver:
+    """A stateless motor driver, shared by the tests in this module."""
+    return MockMotorDriver()
+
+
+@pytest.fixture
+def motor(motor_driver: MockMotorDriver) -> Motor:
+    """A motor backed by the mock driver."""
+    return Motor(0, motor_driver)
+
+
 def test_motor_interface_implementation() -> None:
     """Test that we can implement the MotorInterface."""
     MockMotorDriver()
@@ -43,63 +56,49 @@ def test_motor_interface_class() -> None:
     assert Motor.interface_class() is MotorInterface
 
 
-def test_motor_instantiation() -> None:
+def test_motor_instantiation(motor_driver: MockMotorDriver) -> None:
     """Test that we can instantiate a Motor."""
-    Motor(0, MockMotorDriver())
+    Motor(0, motor_driver)
 
 
-def test_motor_identifier() -> None:
+def test_motor_identifier(motor: Motor) -> None:
     """Test the identifier attribute of the component."""
-    component = Motor(0, MockMotorDriver())
-    assert component.identifier == 0
+    assert motor.identifier == 0
 
 
-def test_motor_get_state_float() -> None:
+@pytest.mark.parametrize(
+    "identifier,expected_type,expected_power",
+    [
+        (0, float, 0.0),
+        (1, float, 0.5),
+        (2, MotorSpecialState, MotorSpecialState.COAST),
+        (3, MotorSpecialState, MotorSpecialState.BRAKE),
+    ],
+)
+def test_motor_get_state(
+    motor_driver: MockMotorDriver,
+    identifier: int,
+    expected_type: Type[MotorState],
+    expected_power: MotorState,
+) -> None:
     """Test that we can get the state of a motor."""
-    motor0 = Motor(0, MockMotorDriver())
-    motor1 = Motor(1, MockMotorDriver())
-
-    assert type(motor0.power) is float
-    assert type(motor1.power) is float
-
-    assert motor0.power == 0
-    assert motor1.power == 0.5
-
+    power = Motor(identifier, motor_driver).power
 
-def test_motor_get_state_special() -> None:
-    """Test that we can get the special state of a motor."""
-    motor0 = Motor(2, MockMotorDriver())
-    motor1 = Motor(3, MockMotorDriver())
+    assert isinstance(power, expected_type)
+    assert power == expected_power
 
-    assert type(motor0.power) is MotorSpecialState
-    assert type(motor1.power) is MotorSpecialState
 
-    assert motor0.power == MotorSpecialState.COAST
-    assert motor1.power == MotorSpecialState.BRAKE
-
-
-def test_motor_set_state() -> None:
+@pytest.mark.parametrize(
+    "power",
+    [0, 1, -1, 0.123, 1.0, -1.0, 1e-9, -0.999999, MotorSpecialState.COAST, MotorSpecialState.BRAKE],
+)
+def test_motor_set_state(motor: Motor, power: MotorState) -> None:
     """Test that we can set the state of a motor."""
-    motor = Motor(0, MockMotorDriver())
-
-    motor.power = 0
-    motor.power = 1
-    motor.power = -1
-    motor.power = 0.123
-
-    motor.power = MotorSpecialState.COAST
-    motor.power = MotorSpecialState.BRAKE
+    motor.power = power
 
 
-def test_motor_set_state_out_of_bounds() -> None:
+@pytest.mark.parametrize("power", [2, 1.1, -3, -1.2, 1.000001, -1.000001, float("inf"), float("-inf")])
+def test_motor_set_state_out_of_bounds(motor: Motor, power: float) -> None:
     """Test that an error is thrown when the state is out of bounds."""
-    motor = Motor(0, MockMotorDriver())
-
-    with pytest.raises(ValueError):
-        motor.power = 2
-    with pytest.raises(ValueError):
-        motor.power = 1.1
-    with pytest.raises(ValueError):
-        motor.power = -3
     with pytest.raises(ValueError):
-        motor.power = -1.2
+        motor.power = power
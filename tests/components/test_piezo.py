@@ -1,10 +1,11 @@
 """Tests for the Piezo Classes."""
 
 from datetime import timedelta
+from typing import Type, Union
 
 import pytest
 
-from j5.components.piezo import Note, Piezo, PiezoInterface
+from j5.components.piezo import Note, Piezo, PiezoInterface, Pitch
 
 
 class MockPiezoDriver(PiezoInterface):
@@ -15,31 +16,40 @@ class MockPiezoDriver(PiezoInterface):
         pass
 
 
+@pytest.fixture(scope="module")
+def piezo_driver() -> MockPiezoDriver:
+    """A stateless piezo driver, shared by the tests in this module."""
+    return MockPiezoDriver()
+
+
+@pytest.fixture
+def piezo(piezo_driver: MockPiezoDriver) -> Piezo:
+    """A piezo backed by the mock driver."""
+    return Piezo(0, piezo_driver)
+
+
 def test_piezo_interface_implementation() -> None:
     """Test that we can implement the PiezoInterface."""
     MockPiezoDriver()
 
 
-def test_piezo_instantiation() -> None:
+def test_piezo_instantiation(piezo_driver: MockPiezoDriver) -> None:
     """Test that we can instantiate an piezo."""
-    Piezo(0, MockPiezoDriver())
+    Piezo(0, piezo_driver)
 
 
-def test_piezo_interface_class_method() -> None:
+def test_piezo_interface_class_method(piezo: Piezo) -> None:
     """Tests piezo's interface_class method."""
-    piezo = Piezo(0, MockPiezoDriver())
     assert piezo.interface_class() is PiezoInterface
 
 
-def test_piezo_identifier() -> None:
+def test_piezo_identifier(piezo: Piezo) -> None:
     """Test the identifier attribute of the component."""
-    component = Piezo(0, MockPiezoDriver())
-    assert component.identifier == 0
+    assert piezo.identifier == 0
 
 
-def test_piezo_buzz_method() -> None:
+def test_piezo_buzz_method(piezo: Piezo) -> None:
     """Tests piezo's buzz method's input validation."""
-    piezo = Piezo(0, MockPiezoDriver())
     piezo.buzz(timedelta(seconds=1), 2093)
     piezo.buzz(timedelta(seconds=1), 2093.23)
     piezo.buzz(timedelta(minutes=1), Note.D7)
@@ -47,23 +57,29 @@ def test_piezo_buzz_method() -> None:
     piezo.buzz(4.3, 2093)
 
 
-def test_piezo_buzz_invalid_value() -> None:
+@pytest.mark.parametrize(
+    "duration,pitch,expected_error",
+    [
+        (timedelta(seconds=1), -42, ValueError),
+        (timedelta(seconds=1), "j5", TypeError),
+        (timedelta(seconds=-2), Note.D7, ValueError),
+        (0, Note.D7, ValueError),
+        (0.0, Note.D7, ValueError),
+        (1.0, 0, ValueError),
+    ],
+)
+def test_piezo_buzz_invalid_value(
+    piezo: Piezo,
+    duration: Union[int, float, timedelta],
+    pitch: Pitch,
+    expected_error: Type[Exception],
+) -> None:
     """Test piezo's buzz method's input validation."""
-    piezo = Piezo(0, MockPiezoDriver())
-    with pytest.raises(ValueError):
-        piezo.buzz(timedelta(seconds=1), -42)
-    with pytest.raises(TypeError):
-        piezo.buzz(timedelta(seconds=1), "j5")  # type: ignore
-    with pytest.raises(ValueError):
-        piezo.buzz(timedelta(seconds=-2), Note.D7)
-    with pytest.raises(ValueError):
-        piezo.buzz(0, Note.D7)
-    with pytest.raises(ValueError):
-        piezo.buzz(0.0, Note.D7)
-    with pytest.raises(ValueError):
-        piezo.buzz(1.0, 0)
+    with pytest.raises(expected_error):
+        piezo.buzz(duration, pitch)
 
 
 def test_note_reversed() -> None:
     """Test Note reversed dunder method."""
-    assert list(reversed(list(Note))) == list(reversed(Note))
+    notes = list(Note)
+    assert list(reversed(Note)) == notes[::-1]
@@ -1,4 +1,8 @@
 """Tests for the power output classes."""
+from typing import Dict
+
+import pytest
+
 from j5.components.power_output import (
     PowerOutput,
     PowerOutputGroup,
@@ -10,7 +14,7 @@ class MockPowerOutputDriver(PowerOutputInterface):
     """A testing driver for power outputs."""
 
     def __init__(self, output_quantity: int = 5) -> None:
-        self._enabled = [False for _ in range(0, output_quantity)]
+        self._enabled = [False] * output_quantity
 
     def get_power_output_enabled(self, identifier: int) -> bool:
         """Get whether a power output is enabled."""
@@ -61,35 +65,50 @@ def test_power_output_enabled() -> None:
 def test_power_output_current() -> None:
     """Test the current property of a PowerOutput."""
     power_output = PowerOutput(0, MockPowerOutputDriver())
-    assert type(power_output.current) is float
-    assert power_output.current == 8.1
+    current = power_output.current
+    assert isinstance(current, float)
+    assert current == 8.1
 
 
-def test_power_output_group_instantiation() -> None:
-    """Test that we can instantiate a PowerOutput group."""
+def _make_power_outputs() -> Dict[int, PowerOutput]:
+    """Build five power outputs sharing a single mock driver."""
     backend = MockPowerOutputDriver(5)
-    outputs = {i: PowerOutput(i, backend) for i in range(0, 5)}
-    group = PowerOutputGroup(outputs)
-    assert type(group) is PowerOutputGroup
+    return {i: PowerOutput(i, backend) for i in range(5)}
+
+
+@pytest.fixture
+def power_outputs() -> Dict[int, PowerOutput]:
+    """Five power outputs in their initial state, for tests that change them."""
+    return _make_power_outputs()
+
+
+@pytest.fixture(scope="module")
+def shared_power_outputs() -> Dict[int, PowerOutput]:
+    """Five power outputs shared across the module, for tests that only read them."""
+    return _make_power_outputs()
+
+
+def test_power_output_group_instantiation(shared_power_outputs: Dict[int, PowerOutput]) -> None:
+    """Test that we can instantiate a PowerOutput group."""
+    group = PowerOutputGroup(shared_power_outputs)
+    assert isinstance(group, PowerOutputGroup)
 
 
-def test_power_output_group_power_toggle() -> None:
+def test_power_output_group_power_toggle(power_outputs: Dict[int, PowerOutput]) -> None:
     """Test that we can toggle a PowerOutputGroup."""
-    outputs = {i: PowerOutput(i, MockPowerOutputDriver()) for i in range(0, 5)}
-    group = PowerOutputGroup(outputs)
+    group = PowerOutputGroup(power_outputs)
 
-    assert not any(output.is_enabled for output in group)
+    assert [output.is_enabled for output in group] == [False] * 5
 
     group.power_on()
-    assert all(output.is_enabled for output in group)
+    assert [output.is_enabled for output in group] == [True] * 5
 
     group.power_off()
-    assert not any(output.is_enabled for output in group)
+    assert [output.is_enabled for output in group] == [False] * 5
 
 
-def test_power_output_group_len() -> None:
+def test_power_output_group_len(shared_power_outputs: Dict[int, PowerOutput]) -> None:
     """Test the length attribute of PowerOutputGroup."""
-    outputs = {i: PowerOutput(i, MockPowerOutputDriver()) for i in range(0, 5)}
-    group = PowerOutputGroup(outputs)
+    group = PowerOutputGroup(shared_power_outputs)
 
     assert len(group) == 5
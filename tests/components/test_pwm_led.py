@@ -1,8 +1,12 @@
 """Tests for the PWM LED component."""
-import unittest
+import re
+
+import pytest
 
 from j5.components.pwm_led import PWMLED, PWMLEDInterface
 
+DUTY_CYCLE_ERROR = re.compile("PWM LED duty cycle must be between 0 and 1")
+
 
 class MockPWMLEDDriver(PWMLEDInterface):
     """A testing driver for the PWM LED."""
@@ -19,55 +23,59 @@ class MockPWMLEDDriver(PWMLEDInterface):
         return self._duty_cycle
 
 
-class TestPWMLEDComponentInterface(unittest.TestCase):
-    """Test that the PWM LED Component and Interface behave as expected."""
+@pytest.fixture
+def pwm_led_driver() -> MockPWMLEDDriver:
+    """A fresh PWM LED driver with a duty cycle of 0.5."""
+    return MockPWMLEDDriver()
+
+
+@pytest.fixture
+def pwm_led(pwm_led_driver: MockPWMLEDDriver) -> PWMLED:
+    """A PWM LED backed by the mock driver."""
+    return PWMLED(0, pwm_led_driver)
+
+
+def test_pwm_led_interface_class() -> None:
+    """Test that the interface class is PWMLEDInterface."""
+    assert PWMLED.interface_class() is PWMLEDInterface
+
+
+def test_pwm_led_identifier(pwm_led: PWMLED) -> None:
+    """Test the identifier attribute of the component."""
+    assert pwm_led.identifier == 0
+
 
-    def setUp(self) -> None:
-        """Set up the test."""
-        self._component = PWMLED(0, MockPWMLEDDriver())
+def test_pwm_led_set_duty_cycle(pwm_led: PWMLED, pwm_led_driver: MockPWMLEDDriver) -> None:
+    """Test setting of duty_cycle property of an LED."""
+    pwm_led.duty_cycle = 0.1
+    assert pwm_led_driver._duty_cycle == 0.1
 
-    def test_pwm_led_interface_class(self) -> None:
-        """Test that the interface class is PWMLEDInterface."""
-        assert PWMLED.interface_class() is PWMLEDInterface
+    pwm_led.duty_cycle = 0.9
+    assert pwm_led_driver._duty_cycle == 0.9
 
-    def test_pwm_led_identifier(self) -> None:
-        """Test the identifier attribute of the component."""
-        self.assertEqual(self._component.identifier, 0)
 
-    def test_pwm_led_set_duty_cycle(self) -> None:
-        """Test setting of duty_cycle property of an LED."""
-        self._component.duty_cycle = 0.1
-        self.assertEqual(self._component._backend._duty_cycle, 0.1)  # type: ignore
+def test_pwm_led_get_duty_cycle(pwm_led: PWMLED, pwm_led_driver: MockPWMLEDDriver) -> None:
+    """Test getting of duty_cycle property of an LED."""
+    assert pwm_led.duty_cycle == 0.5  # Initially set to 0.5
 
-        self._component.duty_cycle = 0.9
-        self.assertEqual(self._component._backend._duty_cycle, 0.9)  # type: ignore
+    # Change the state manually
+    pwm_led_driver._duty_cycle = 0.1
+    assert pwm_led.duty_cycle == 0.1
 
-    def test_pwm_led_get_duty_cycle(self) -> None:
-        """Test getting of duty_cycle property of an LED."""
-        self.assertEqual(self._component.duty_cycle, 0.5)  # Initially set to 0.5
 
-        # Change the state manually
-        self._component._backend._duty_cycle = 0.1  # type: ignore
-        self.assertEqual(self._component.duty_cycle, 0.1)
+def test_pwm_led_set_duty_cycle_upper_bound(pwm_led: PWMLED) -> None:
+    """Test the upper bound on the duty cycle."""
+    pwm_led.duty_cycle = 1
+    assert pwm_led.duty_cycle == 1
 
-    def test_pwm_led_set_duty_cycle_upper_bound(self) -> None:
-        """Test the upper bound on the duty cycle."""
-        self._component.duty_cycle = 1
-        self.assertEqual(self._component.duty_cycle, 1)
+    with pytest.raises(ValueError, match=DUTY_CYCLE_ERROR):
+        pwm_led.duty_cycle = 1.0001
 
-        with self.assertRaisesRegex(
-            ValueError,
-            "PWM LED duty cycle must be between 0 and 1",
-        ):
-            self._component.duty_cycle = 1.0001
 
-    def test_pwm_led_set_duty_cycle_lower_bound(self) -> None:
-        """Test the lower bound on the duty cycle."""
-        self._component.duty_cycle = 0
-        self.assertEqual(self._component.duty_cycle, 0)
+def test_pwm_led_set_duty_cycle_lower_bound(pwm_led: PWMLED) -> None:
+    """Test the lower bound on the duty cycle."""
+    pwm_led.duty_cycle = 0
+    assert pwm_led.duty_cycle == 0
 
-        with self.assertRaisesRegex(
-            ValueError,
-            "PWM LED duty cycle must be between 0 and 1",
-        ):
-            self._component.duty_cycle = -0.0001
+    with pytest.raises(ValueError, match=DUTY_CYCLE_ERROR):
+        pwm_led.duty_cycle = -0.0001
@@ -1,14 +1,22 @@
 """Tests for the RGB LED component."""
-import unittest
+import re
+from typing import ClassVar, Dict, Tuple
+
+import pytest
 
 from j5.components.rgb_led import RGBLED, RGBColour, RGBLEDInterface
 
+DUTY_CYCLE_ERROR = re.compile("PWM LED duty cycle must be between 0 and 1")
+BAD_CHANNEL_ERROR = re.compile("bees is not a RGB colour")
+
 
 class MockRGBLEDDriver(RGBLEDInterface):
     """A testing driver for the RGB LED."""
 
+    INITIAL_DUTY_CYCLES: ClassVar[Dict[RGBColour, float]] = dict.fromkeys(RGBColour, 0.5)
+
     def __init__(self) -> None:
-        self._duty_cycles = {colour: 0.5 for colour in RGBColour}  # Initialise
+        self._duty_cycles = self.INITIAL_DUTY_CYCLES.copy()
 
     def get_rgb_led_channel_duty_cycle(
         self,
@@ -40,188 +48,193 @@ class MockRGBLEDDriver(RGBLEDInterface):
         self._duty_cycles[channel] = duty_cycle
 
 
-class TestRGBLEDComponentInterface(unittest.TestCase):
-    """Test that the RGB LED Component and Interface behave as expected."""
-
-    def setUp(self) -> None:
-        """Set up the test."""
-        self._component = RGBLED(0, MockRGBLEDDriver())
-
-    def test_rgb_led_interface_class(self) -> None:
-        """Test that the interface class is PWMLEDInterface."""
-        assert RGBLED.interface_class() is RGBLEDInterface
-
-    def test_rgb_led_identifier(self) -> None:
-        """Test the identifier attribute of the component."""
-        self.assertEqual(self._component.identifier, 0)
-
-    def test_rgb_led_get_channel_string(self) -> None:
-        """Test getting the duty cycle of a channel by string."""
-        self.assertEqual(self._component.get_channel("red"), 0.5)  # Initially set to 0.5
-
-        # Change the state manually
-        self._component._backend._duty_cycles[RGBColour.RED] = 0.1  # type: ignore
-        self.assertEqual(self._component.get_channel("red"), 0.1)
-
-    def test_rgb_led_get_channel_enum(self) -> None:
-        """Test getting the duty cycle of a channel by enum."""
-        self.assertEqual(self._component.get_channel(RGBColour.RED), 0.5)
-
-        # Change the state manually
-        self._component._backend._duty_cycles[RGBColour.RED] = 0.1  # type: ignore
-        self.assertEqual(self._component.get_channel(RGBColour.RED), 0.1)
-
-    def test_rgb_led_get_channel_available_enum(self) -> None:
-        """Test that we can get a channel for each of the enum."""
-        self.assertEqual(self._component.get_channel(RGBColour.RED), 0.5)
-        self.assertEqual(self._component.get_channel(RGBColour.GREEN), 0.5)
-        self.assertEqual(self._component.get_channel(RGBColour.BLUE), 0.5)
-
-    def test_rgb_led_get_channel_available_string(self) -> None:
-        """Test that we can get a channel for each of the string."""
-        self.assertEqual(self._component.get_channel("red"), 0.5)
-        self.assertEqual(self._component.get_channel("green"), 0.5)
-        self.assertEqual(self._component.get_channel("blue"), 0.5)
-
-        # Also check uppercase
-        self.assertEqual(self._component.get_channel("RED"), 0.5)
-        self.assertEqual(self._component.get_channel("GREEN"), 0.5)
-        self.assertEqual(self._component.get_channel("BLUE"), 0.5)
-
-    def test_rgb_led_get_channel_bad_string(self) -> None:
-        """Test that we get an error for a bad channel string."""
-        with self.assertRaisesRegex(ValueError, "bees is not a RGB colour"):
-            self._component.get_channel("bees")
-
-    def test_rgb_led_set_channel_string(self) -> None:
-        """Test setting the duty cycle of a channel by string."""
-        self._component.set_channel("red", 0.9)
-        self.assertEqual(
-            self._component._backend._duty_cycles[RGBColour.RED],  # type: ignore
-            0.9,
-        )
-
-    def test_rgb_led_set_channel_enum(self) -> None:
-        """Test setting the duty cycle of a channel by enum."""
-        self._component.set_channel(RGBColour.RED, 0.9)
-        self.assertEqual(
-            self._component._backend._duty_cycles[RGBColour.RED],  # type: ignore
-            0.9,
-        )
-
-    def test_rgb_led_set_channel_available_enum(self) -> None:
-        """Test that we can set a channel for each of the enum."""
-        self._component.set_channel(RGBColour.RED, 0.5)
-        self._component.set_channel(RGBColour.GREEN, 0.5)
-        self._component.set_channel(RGBColour.BLUE, 0.5)
-
-    def test_rgb_led_set_channel_available_string(self) -> None:
-        """Test that we can set a channel for each of the string."""
-        self._component.set_channel("red", 0.5)
-        self._component.set_channel("green", 0.5)
-        self._component.set_channel("blue", 0.5)
-
-        # Also check uppercase
-        self._component.set_channel("RED", 0.5)
-        self._component.set_channel("GREEN", 0.5)
-        self._component.set_channel("BLUE", 0.5)
-
-    def test_rgb_led_set_channel_bad_string(self) -> None:
-        """Test that we get an error for a bad channel string."""
-        with self.assertRaisesRegex(ValueError, "bees is not a RGB colour"):
-            self._component.set_channel("bees", 0.5)
-
-    def test_rgb_led_set_duty_cycle_upper_bound(self) -> None:
-        """Test the upper bound on the duty cycle."""
-        self._component.set_channel("red", 1)
-        self.assertEqual(
-            self._component._backend._duty_cycles[RGBColour.RED],  # type: ignore
-            1,
-        )
-
-        with self.assertRaisesRegex(
-            ValueError,
-            "PWM LED duty cycle must be between 0 and 1",
-        ):
-            self._component.set_channel("red", 1.0001)
-
-    def test_rgb_led_set_duty_cycle_lower_bound(self) -> None:
-        """Test the lower bound on the duty cycle."""
-        self._component.set_channel("red", 0)
-        self.assertEqual(
-            self._component._backend._duty_cycles[RGBColour.RED],  # type: ignore
-            0,
-        )
-
-        with self.assertRaisesRegex(
-            ValueError,
-            "PWM LED duty cycle must be between 0 and 1",
-        ):
-            self._component.set_channel("red", -0.0001)
-
-    def test_rgb_led_get_red_channel(self) -> None:
-        """Test that we can get the red channel."""
-        self.assertEqual(self._component.red, 0.5)
-
-        self._component._backend._duty_cycles[RGBColour.RED] = 0.1  # type: ignore
-        self.assertEqual(self._component.red, 0.1)
-
-    def test_rgb_led_set_red_channel(self) -> None:
-        """Test that we can set the red channel."""
-        self._component.red = 0.8
-        self.assertEqual(
-            self._component._backend._duty_cycles[RGBColour.RED],  # type: ignore
-            0.8,
-        )
-
-    def test_rgb_led_get_green_channel(self) -> None:
-        """Test that we can get the green channel."""
-        self.assertEqual(self._component.green, 0.5)
-
-        self._component._backend._duty_cycles[RGBColour.GREEN] = 0.1  # type: ignore
-        self.assertEqual(self._component.green, 0.1)
-
-    def test_rgb_led_set_green_channel(self) -> None:
-        """Test that we can set the green channel."""
-        self._component.green = 0.8
-        self.assertEqual(
-            self._component._backend._duty_cycles[RGBColour.GREEN],  # type: ignore
-            0.8,
-        )
-
-    def test_rgb_led_get_blue_channel(self) -> None:
-        """Test that we can get the blue channel."""
-        self.assertEqual(self._component.blue, 0.5)
-
-        self._component._backend._duty_cycles[RGBColour.BLUE] = 0.1  # type: ignore
-        self.assertEqual(self._component.blue, 0.1)
-
-    def test_rgb_led_set_blue_channel(self) -> None:
-        """Test that we can set the blue channel."""
-        self._component.blue = 0.8
-        self.assertEqual(
-            self._component._backend._duty_cycles[RGBColour.BLUE],  # type: ignore
-            0.8,
-        )
-
-    def test_rgb_led_get_rgb_tuple(self) -> None:
-        """Test that we can get the colour as a RGB tuple."""
-        self.assertEqual(self._component.rgb, (0.5, 0.5, 0.5))
-
-        self._component.red = 1
-        self._component.green = 0.6
-        self._component.blue = 0
-        self.assertEqual(self._component.rgb, (1, 0.6, 0))
-
-    def test_rgb_led_set_rgb_tuple(self) -> None:
-        """Test that we can set the colour as a RGB tuple."""
-        self._component.rgb = (1, 0.6, 0)
-
-        self.assertEqual(self._component.red, 1)
-        self.assertEqual(self._component.green, 0.6)
-        self.assertEqual(self._component.blue, 0)
-
-    def test_rgb_led_set_rgb_tuple_out_of_bound(self) -> None:
-        """Test that we catch an out of bound value in RGB tuple."""
-        with self.assertRaises(ValueError):
-            self._component.rgb = (1, 1.2, 0)
+CHANNEL_NAMES = ["red", "green", "blue", "RED", "GREEN", "BLUE"]
+
+INITIAL_RGB = (0.5, 0.5, 0.5)
+
+RGB_SAMPLES = [
+    (1, 0.6, 0),
+    (0, 0, 0),
+    (1, 1, 1),
+    (0.25, 0.5, 0.75),
+]
+
+CHANNEL_ATTRIBUTES = [
+    ("red", RGBColour.RED),
+    ("green", RGBColour.GREEN),
+    ("blue", RGBColour.BLUE),
+]
+
+
+@pytest.fixture
+def rgb_driver() -> MockRGBLEDDriver:
+    """A fresh RGB LED driver with every channel at 0.5."""
+    return MockRGBLEDDriver()
+
+
+@pytest.fixture
+def rgb_led(rgb_driver: MockRGBLEDDriver) -> RGBLED:
+    """An RGB LED backed by the mock driver."""
+    return RGBLED(0, rgb_driver)
+
+
+def test_rgb_led_interface_class() -> None:
+    """Test that the interface class is PWMLEDInterface."""
+    assert RGBLED.interface_class() is RGBLEDInterface
+
+
+def test_rgb_led_identifier(rgb_led: RGBLED) -> None:
+    """Test the identifier attribute of the component."""
+    assert rgb_led.identifier == 0
+
+
+def test_rgb_led_get_channel_string(rgb_led: RGBLED, rgb_driver: MockRGBLEDDriver) -> None:
+    """Test getting the duty cycle of a channel by string."""
+    assert rgb_led.get_channel("red") == 0.5  # Initially set to 0.5
+
+    # Change the state manually
+    rgb_driver._duty_cycles[RGBColour.RED] = 0.1
+    assert rgb_led.get_channel("red") == 0.1
+
+
+def test_rgb_led_get_channel_enum(rgb_led: RGBLED, rgb_driver: MockRGBLEDDriver) -> None:
+    """Test getting the duty cycle of a channel by enum."""
+    assert rgb_led.get_channel(RGBColour.RED) == 0.5
+
+    # Change the state manually
+    rgb_driver._duty_cycles[RGBColour.RED] = 0.1
+    assert rgb_led.get_channel(RGBColour.RED) == 0.1
+
+
+@pytest.mark.parametrize("channel", list(RGBColour))
+def test_rgb_led_get_channel_available_enum(rgb_led: RGBLED, channel: RGBColour) -> None:
+    """Test that we can get a channel for each of the enum."""
+    assert rgb_led.get_channel(channel) == 0.5
+
+
+@pytest.mark.parametrize("channel", CHANNEL_NAMES)
+def test_rgb_led_get_channel_available_string(rgb_led: RGBLED, channel: str) -> None:
+    """Test that we can get a channel for each of the string, in either case."""
+    assert rgb_led.get_channel(channel) == 0.5
+
+
+@pytest.mark.parametrize(
+    "name,colour",
+    [("Red", RGBColour.RED), ("gReen", RGBColour.GREEN), ("bluE", RGBColour.BLUE)],
+)
+def test_rgb_led_channel_mixed_case_name(
+    rgb_led: RGBLED,
+    rgb_driver: MockRGBLEDDriver,
+    name: str,
+    colour: RGBColour,
+) -> None:
+    """Test that a mixed case channel name resolves to the right colour."""
+    rgb_led.set_channel(name, 0.9)
+    assert rgb_driver._duty_cycles[colour] == 0.9
+    assert rgb_led.get_channel(name) == 0.9
+
+
+def test_rgb_led_get_channel_bad_string(rgb_led: RGBLED) -> None:
+    """Test that we get an error for a bad channel string."""
+    with pytest.raises(ValueError, match=BAD_CHANNEL_ERROR):
+        rgb_led.get_channel("bees")
+
+
+def test_rgb_led_set_channel_string(rgb_led: RGBLED, rgb_driver: MockRGBLEDDriver) -> None:
+    """Test setting the duty cycle of a channel by string."""
+    rgb_led.set_channel("red", 0.9)
+    assert rgb_driver._duty_cycles[RGBColour.RED] == 0.9
+
+
+def test_rgb_led_set_channel_enum(rgb_led: RGBLED, rgb_driver: MockRGBLEDDriver) -> None:
+    """Test setting the duty cycle of a channel by enum."""
+    rgb_led.set_channel(RGBColour.RED, 0.9)
+    assert rgb_driver._duty_cycles[RGBColour.RED] == 0.9
+
+
+@pytest.mark.parametrize("channel", list(RGBColour))
+def test_rgb_led_set_channel_available_enum(rgb_led: RGBLED, channel: RGBColour) -> None:
+    """Test that we can set a channel for each of the enum."""
+    rgb_led.set_channel(channel, 0.5)
+
+
+@pytest.mark.parametrize("channel", CHANNEL_NAMES)
+def test_rgb_led_set_channel_available_string(rgb_led: RGBLED, channel: str) -> None:
+    """Test that we can set a channel for each of the string, in either case."""
+    rgb_led.set_channel(channel, 0.5)
+
+
+def test_rgb_led_set_channel_bad_string(rgb_led: RGBLED) -> None:
+    """Test that we get an error for a bad channel string."""
+    with pytest.raises(ValueError, match=BAD_CHANNEL_ERROR):
+        rgb_led.set_channel("bees", 0.5)
+
+
+def test_rgb_led_set_duty_cycle_upper_bound(rgb_led: RGBLED, rgb_driver: MockRGBLEDDriver) -> None:
+    """Test the upper bound on the duty cycle."""
+    rgb_led.set_channel("red", 1)
+    assert rgb_driver._duty_cycles[RGBColour.RED] == 1
+
+    with pytest.raises(ValueError, match=DUTY_CYCLE_ERROR):
+        rgb_led.set_channel("red", 1.0001)
+
+
+def test_rgb_led_set_duty_cycle_lower_bound(rgb_led: RGBLED, rgb_driver: MockRGBLEDDriver) -> None:
+    """Test the lower bound on the duty cycle."""
+    rgb_led.set_channel("red", 0)
+    assert rgb_driver._duty_cycles[RGBColour.RED] == 0
+
+    with pytest.raises(ValueError, match=DUTY_CYCLE_ERROR):
+        rgb_led.set_channel("red", -0.0001)
+
+
+@pytest.mark.parametrize("attribute,channel", CHANNEL_ATTRIBUTES)
+def test_rgb_led_get_channel_attribute(
+    rgb_led: RGBLED,
+    rgb_driver: MockRGBLEDDriver,
+    attribute: str,
+    channel: RGBColour,
+) -> None:
+    """Test that we can get each channel through its attribute."""
+    assert getattr(rgb_led, attribute) == 0.5
+
+    rgb_driver._duty_cycles[channel] = 0.1
+    assert getattr(rgb_led, attribute) == 0.1
+
+
+@pytest.mark.parametrize("attribute,channel", CHANNEL_ATTRIBUTES)
+def test_rgb_led_set_channel_attribute(
+    rgb_led: RGBLED,
+    rgb_driver: MockRGBLEDDriver,
+    attribute: str,
+    channel: RGBColour,
+) -> None:
+    """Test that we can set each channel through its attribute."""
+    setattr(rgb_led, attribute, 0.8)
+    assert rgb_driver._duty_cycles[channel] == 0.8
+
+
+def test_rgb_led_get_initial_rgb_tuple(rgb_led: RGBLED) -> None:
+    """Test that the colour starts at the driver's initial duty cycles."""
+    assert rgb_led.rgb == INITIAL_RGB
+
+
+@pytest.mark.parametrize("rgb", RGB_SAMPLES)
+def test_rgb_led_get_rgb_tuple(rgb_led: RGBLED, rgb: Tuple[float, float, float]) -> None:
+    """Test that we can get the colour as a RGB tuple."""
+    rgb_led.red, rgb_led.green, rgb_led.blue = rgb
+    assert rgb_led.rgb == rgb
+
+
+@pytest.mark.parametrize("rgb", RGB_SAMPLES)
+def test_rgb_led_set_rgb_tuple(rgb_led: RGBLED, rgb: Tuple[float, float, float]) -> None:
+    """Test that we can set the colour as a RGB tuple."""
+    rgb_led.rgb = rgb
+
+    assert (rgb_led.red, rgb_led.green, rgb_led.blue) == rgb
+
+
+def test_rgb_led_set_rgb_tuple_out_of_bound(rgb_led: RGBLED) -> None:
+    """Test that we catch an out of bound value in RGB tuple."""
+    with pytest.raises(ValueError):
+        rgb_led.rgb = (1, 1.2, 0)
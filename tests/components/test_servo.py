@@ -3,13 +3,15 @@ import pytest
 
 from j5.components.servo import Servo, ServoInterface, ServoPosition
 
+SERVO_POSITION = 0.5
+
 
 class MockServoDriver(ServoInterface):
     """A testing driver for servos."""
 
     def get_servo_position(self, identifier: int) -> ServoPosition:
         """Get the position of a Servo."""
-        return 0.5
+        return SERVO_POSITION
 
     def set_servo_position(
         self,
@@ -20,6 +22,18 @@ class MockServoDriver(ServoInterface):
         pass
 
 
+@pytest.fixture(scope="module")
+def servo_driver() -> MockServoDriver:
+    """A stateless servo driver, shared by the tests in this module."""
+    return MockServoDriver()
+
+
+@pytest.fixture
+def servo(servo_driver: MockServoDriver) -> Servo:
+    """A servo backed by the mock driver."""
+    return Servo(2, servo_driver)
+
+
 def test_servo_interface_implementation() -> None:
     """Test that we can implement the ServoInterface."""
     MockServoDriver()
@@ -30,42 +44,35 @@ def test_servo_interface_class() -> None:
     assert Servo.interface_class() is ServoInterface
 
 
-def test_servo_instantiation() -> None:
+def test_servo_instantiation(servo_driver: MockServoDriver) -> None:
     """Test that we can instantiate a Servo."""
-    Servo(0, MockServoDriver())
+    Servo(0, servo_driver)
 
 
-def test_servo_identifier() -> None:
+def test_servo_identifier(servo: Servo) -> None:
     """Test the identifier attribute of the component."""
-    component = Servo(0, MockServoDriver())
-    assert component.identifier == 0
+    assert servo.identifier == 2
 
 
-def test_servo_get_position() -> None:
+def test_servo_get_position(servo: Servo) -> None:
     """Test that we can get the position of a servo."""
-    servo = Servo(2, MockServoDriver())
-    assert type(servo.position) is float
-    assert servo.position == 0.5
+    position = servo.position
+    assert isinstance(position, float)
+    assert position == SERVO_POSITION
 
 
-def test_servo_set_position() -> None:
+def test_servo_set_position(servo: Servo) -> None:
     """Test that we can set the position of a servo."""
-    servo = Servo(2, MockServoDriver())
     servo.position = 0.6
 
 
-def test_servo_set_position_none() -> None:
+def test_servo_set_position_none(servo: Servo) -> None:
     """Test that we can set the position of a servo to None."""
-    servo = Servo(2, MockServoDriver())
     servo.position = None
 
 
-def test_servo_set_position_out_of_bounds() -> None:
+@pytest.mark.parametrize("position", [2, -2])
+def test_servo_set_position_out_of_bounds(servo: Servo, position: float) -> None:
     """Test that we cannot set < -1 or > 1."""
-    servo = Servo(2, MockServoDriver())
-
-    with pytest.raises(ValueError):
-        servo.position = 2
-
     with pytest.raises(ValueError):
-        servo.position = -2
+        servo.position = position
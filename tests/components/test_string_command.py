@@ -7,6 +7,8 @@ from j5.components.string_command import (
     StringCommandComponentInterface,
 )
 
+BAD_COMMANDS = ["", 9]
+
 
 class MockStringCommandDriver(StringCommandComponentInterface):
     """A testing driver for the string command component.."""
@@ -16,6 +18,12 @@ class MockStringCommandDriver(StringCommandComponentInterface):
         return command[::-1]  # reverse the string
 
 
+@pytest.fixture
+def string_command() -> StringCommandComponent:
+    """A string command component backed by the mock driver."""
+    return StringCommandComponent(0, MockStringCommandDriver())
+
+
 def test_string_command_interface_implementation() -> None:
     """Test that we can implement the interface."""
     MockStringCommandDriver()
@@ -31,33 +39,30 @@ def test_string_command_instantiation() -> None:
     StringCommandComponent(0, MockStringCommandDriver())
 
 
-def test_string_command_identifier() -> None:
+def test_string_command_identifier(string_command: StringCommandComponent) -> None:
     """Test that we can get the identifer of the component."""
-    scc = StringCommandComponent(0, MockStringCommandDriver())
-    assert scc.identifier == 0
+    assert string_command.identifier == 0
 
 
-def test_string_command_execute_command() -> None:
+def test_string_command_execute_command(string_command: StringCommandComponent) -> None:
     """Test that we can execute a command."""
-    scc = StringCommandComponent(0, MockStringCommandDriver())
+    assert string_command.execute("foo") == "oof"
 
-    assert scc.execute("foo") == "oof"
 
+@pytest.mark.parametrize("command", BAD_COMMANDS)
+def test_string_command_execute_bad_command(string_command: StringCommandComponent, command: object) -> None:
+    """Test that we cannot execute an empty or non-string command."""
     with pytest.raises(ValueError):
-        scc.execute("")
+        string_command.execute(command)  # type: ignore
 
-    with pytest.raises(ValueError):
-        scc.execute(9)  # type: ignore
 
-
-def test_string_command_callable() -> None:
+def test_string_command_callable(string_command: StringCommandComponent) -> None:
     """Test that we can execute a command using the callable."""
-    scc = StringCommandComponent(0, MockStringCommandDriver())
-
-    assert scc("foo") == "oof"
+    assert string_command("foo") == "oof"
 
-    with pytest.raises(ValueError):
-        scc("")
 
+@pytest.mark.parametrize("command", BAD_COMMANDS)
+def test_string_command_callable_bad_command(string_command: StringCommandComponent, command: object) -> None:
+    """Test that we cannot call with an empty or non-string command."""
     with pytest.raises(ValueError):
-        scc(9)  # type: ignore
+        string_command(command)  # type: ignore
@@ -1,6 +1,7 @@
 """Test the full stack."""
 
 import socket
+from typing import Any, Iterator, Tuple
 
 import pytest
 
@@ -15,9 +16,41 @@ class Robot(BaseRobot):
         self.debug = debug
 
 
-def test_robot_lock() -> None:
+class MockLockSocket:
+    """A stand-in for the lock socket that never touches the OS."""
+
+    def __init__(self, *args: Any) -> None:
+        self._address: Tuple[str, int] = ("", 0)
+
+    def bind(self, address: Tuple[str, int]) -> None:
+        """Pretend to bind to the address."""
+        self._address = address
+
+    def getsockname(self) -> Tuple[str, int]:
+        """Get the address we pretended to bind to."""
+        return self._address
+
+    def close(self) -> None:
+        """Pretend to close the socket."""
+
+
+@pytest.fixture
+def fake_lock_socket(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the lock socket, for tests that don't exercise locking."""
+    monkeypatch.setattr("j5.base_robot.socket.socket", MockLockSocket)
+
+
+@pytest.fixture
+def robot() -> Iterator[Robot]:
+    """A robot holding the lock, which is released after the test."""
+    r = Robot()
+    yield r
+    r._lock.close()
+
+
+def test_robot_lock(robot: Robot) -> None:
     """Test that we cannot have more than one Robot object."""
-    r1 = Robot()
+    r1 = robot
 
     r1._obtain_lock()  # Check we can re-obtain the lock on the same object.
 
@@ -28,8 +61,7 @@ def test_robot_lock() -> None:
         Robot()
 
 
-def test_robot_with_args() -> None:
+def test_robot_with_args(fake_lock_socket: None) -> None:
     """Test that a Robot can accept additional args."""
     r = Robot(debug=True)
-
     assert r.debug
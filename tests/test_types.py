@@ -1,8 +1,25 @@
 """Test custom types."""
+from typing import Type, Union
+
 import pytest
 
 from j5.types import ImmutableDict, ImmutableList
 
+DICT_DATA = {"foo": "bar", "bar": "doo", "doo": "foo"}
+LIST_DATA = [1, 3, 4, 6, 2]
+
+
+@pytest.fixture(scope="module")
+def immutable_dict() -> ImmutableDict[str, str]:
+    """An ImmutableDict of DICT_DATA, shared as it cannot be changed."""
+    return ImmutableDict(DICT_DATA)
+
+
+@pytest.fixture(scope="module")
+def immutable_list() -> ImmutableList[int]:
+    """An ImmutableList of LIST_DATA, shared as it cannot be changed."""
+    return ImmutableList[int](LIST_DATA)
+
 
 def test_immutable_dict_get_member() -> None:
     """Test that we can get an item from an ImmutableDict."""
@@ -11,29 +28,20 @@ def test_immutable_dict_get_member() -> None:
     assert d["foo"] == "bar"
 
 
-def test_immutable_dict_iterator() -> None:
+def test_immutable_dict_iterator(immutable_dict: ImmutableDict[str, str]) -> None:
     """Test that the iterator works."""
-    data = {"foo": "bar", "bar": "doo", "doo": "foo"}
-    d = ImmutableDict(data)
-
-    assert list(d) == list(data.values())
+    assert list(immutable_dict) == list(DICT_DATA.values())
 
 
-def test_immutable_dict_length() -> None:
+def test_immutable_dict_length(immutable_dict: ImmutableDict[str, str]) -> None:
     """Test that the length operation works."""
-    data = {"foo": "bar", "bar": "doo", "doo": "foo"}
-    d = ImmutableDict(data)
-
-    assert len(d) == 3
+    assert len(immutable_dict) == 3
 
 
-def test_immutable_dict_cannot_set_member() -> None:
+def test_immutable_dict_cannot_set_member(immutable_dict: ImmutableDict[str, str]) -> None:
     """Test that the immutable dict is immutable."""
-    data = {"foo": "bar", "bar": "doo", "doo": "foo"}
-    d = ImmutableDict(data)
-
     with pytest.raises(TypeError):
-        d["foo"] = "12"  # type: ignore
+        immutable_dict["foo"] = "12"  # type: ignore
 
 
 def test_immutable_dict_repr() -> None:
@@ -45,52 +53,44 @@ def test_immutable_dict_repr() -> None:
 
 def test_immutable_list_construct_from_list() -> None:
     """Test that we can construct an ImmutableList from a list."""
-    data = [1, 3, 4, 6, 2]
-    li = ImmutableList[int](data)
-    assert list(li) == data
+    li = ImmutableList[int](LIST_DATA)
+    assert list(li) == LIST_DATA
 
 
 def test_immutable_list_construct_from_generator() -> None:
     """Test that we can construct an ImmutableList from a generator."""
-    data = [1, 3, 4, 6, 2]
-    li = ImmutableList[int](item for item in data)
-    assert list(li) == data
+    li = ImmutableList[int](item for item in LIST_DATA)
+    assert list(li) == LIST_DATA
 
 
-def test_immutable_list_get_item() -> None:
+def test_immutable_list_get_item(immutable_list: ImmutableList[int]) -> None:
     """Test that we can get an item from an ImmutableList."""
-    data = [1, 3, 4, 6, 2]
-    li = ImmutableList[int](data)
+    assert immutable_list[0] == 1
+    assert immutable_list[-1] == 2
 
-    assert li[0] == 1
-    assert li[-1] == 2
 
-    with pytest.raises(IndexError):
-        assert li[7]
-
-    with pytest.raises(TypeError):
-        assert li["foo"]  # type:ignore
+@pytest.mark.parametrize("index,expected_error", [(7, IndexError), ("foo", TypeError)])
+def test_immutable_list_get_bad_item(
+    immutable_list: ImmutableList[int],
+    index: Union[int, str],
+    expected_error: Type[Exception],
+) -> None:
+    """Test that getting an out of range or non-integer index fails."""
+    with pytest.raises(expected_error):
+        assert immutable_list[index]  # type: ignore
 
 
-def test_immutable_list_length() -> None:
+def test_immutable_list_length(immutable_list: ImmutableList[int]) -> None:
     """Test that we can get the list length."""
-    data = [1, 3, 4, 6, 2]
-    li = ImmutableList[int](data)
+    assert len(immutable_list) == 5
 
-    assert len(li) == 5
 
-
-def test_immutable_list_cannot_set_item() -> None:
+def test_immutable_list_cannot_set_item(immutable_list: ImmutableList[int]) -> None:
     """Test that the list is not immutable."""
-    data = [1, 3, 4, 6, 2]
-    li = ImmutableList[int](data)
-
     with pytest.raises(TypeError):
-        li[0] = 12  # type: ignore
+        immutable_list[0] = 12  # type: ignore
 
 
-def test_immutable_list_repr() -> None:
+def test_immutable_list_repr(immutable_list: ImmutableList[int]) -> None:
     """Test that the repr of the immutable list is correct."""
-    data = [1, 3, 4, 6, 2]
-    d = ImmutableList(data)
-    assert repr(d) == "ImmutableList([1, 3, 4, 6, 2])"
+    assert repr(immutable_list) == "ImmutableList([1, 3, 4, 6, 2])"
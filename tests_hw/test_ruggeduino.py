@@ -41,7 +41,6 @@ if __name__ == "__main__":
 
     print("Setting all pins low.")
     for pin in range(2, 14):
-        r.arduino.pins[pin].mode = GPIOPinMode.DIGITAL_OUTPUT
         r.arduino.pins[pin].digital_write(False)
 
     sleep(1)
@@ -5,11 +5,14 @@ Tool to extract code snippets from the README into separate files.
 
 Code snippets begin with a line starting with "```python" and end at a line
 starting with "```".
+
+Pass "-" as the input file to read the document from stdin.
 """
 
 import argparse
+import sys
 from pathlib import Path
-from typing import Set
+from typing import Iterable, List, Optional, Set
 
 ignored_flake8_rules: Set[str] = set()
 
@@ -28,8 +31,7 @@ class SnippetWriter:
         :param contents: contents of file.
         """
         path = self.output_path / f"snippet{self.next_num:04d}.py"
-        with open(path, "w") as file:
-            file.write(contents)
+        path.write_text(contents)
         self.next_num += 1
 
 
@@ -40,24 +42,34 @@ def extract(input_path: Path, snippet_writer: SnippetWriter) -> None:
     :param input_path: path to search in.
     :param snippet_writer: snippet writer instance.
     """
-    current_code_block = None
-    unchecked = None
     with open(input_path) as input_file:
-        for line in input_file:
-            if current_code_block is not None:
-                if line.startswith("```"):
-                    # end code block
-                    if not unchecked:
-                        snippet_writer.write(current_code_block)
-                    current_code_block = None
-                else:
-                    # line inside a code block
-                    current_code_block += line
+        extract_lines(input_file, snippet_writer)
+
+
+def extract_lines(lines: Iterable[str], snippet_writer: SnippetWriter) -> None:
+    """
+    Look for code snippets in lines and send them to the snippet_writer.
+
+    :param lines: lines to search in, including line endings.
+    :param snippet_writer: snippet writer instance.
+    """
+    current_code_block: Optional[List[str]] = None
+    unchecked = None
+    for line in lines:
+        if current_code_block is not None:
+            if line.startswith("```"):
+                # end code block
+                if not unchecked:
+                    snippet_writer.write("".join(current_code_block))
+                current_code_block = None
             else:
-                if line.startswith("```python"):
-                    # start code block
-                    current_code_block = ""
-                    unchecked = "unchecked" in line
+                # line inside a code block
+                current_code_block.append(line)
+        else:
+            if line.startswith("```python"):
+                # start code block
+                current_code_block = []
+                unchecked = "unchecked" in line
 
 
 def main() -> None:
@@ -66,7 +78,11 @@ def main() -> None:
     parser.add_argument("input_file", type=Path)
     parser.add_argument("output_dir", type=Path)
     args = parser.parse_args()
-    extract(args.input_file, SnippetWriter(args.output_dir))
+    snippet_writer = SnippetWriter(args.output_dir)
+    if str(args.input_file) == "-":
+        extract_lines(sys.stdin, snippet_writer)
+    else:
+        extract(args.input_file, snippet_writer)
 
 
 if __name__ == "__main__":
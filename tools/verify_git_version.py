@@ -6,6 +6,7 @@ For use in CD when auto-releasing to PyPI.
 Heavily derived from phial: https://github.com/sedders123/phial/blob/develop/setup.py
 """
 
+import ast
 import os
 import re
 import sys
@@ -13,6 +14,8 @@ from pathlib import Path
 
 BASE_DIR = Path(__file__).parents[1]
 
+TAG_RE = re.compile(r"refs/tags/(.+)")
+
 
 def find_version(*file_paths: str) -> str:
     """
@@ -25,10 +28,12 @@ def find_version(*file_paths: str) -> str:
     with BASE_DIR.joinpath(*file_paths).open() as fp:
         version_file = fp.read()
 
-    version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", version_file, re.M)
-    if version_match:
-        raw_version = version_match.group(1)
-        return f"v{raw_version}"
+    for node in ast.parse(version_file).body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__version__" for target in node.targets
+        ):
+            raw_version = ast.literal_eval(node.value)
+            return f"v{raw_version}"
     raise RuntimeError("Unable to find version string.")
 
 
@@ -36,7 +41,7 @@ def run() -> None:
     """Check the git version matches the j5 version."""
     tag_ref = os.getenv("GITHUB_REF") or "ENV NOT SET"
 
-    tag_match = re.match(r"refs/tags/(.+)", tag_ref)
+    tag_match = TAG_RE.match(tag_ref)
 
     if tag_match:
         (tag,) = tag_match.groups()